@@ -13,6 +13,7 @@ from CommonServerPython import *
 urllib3.disable_warnings()
 
 SERVICE = "s3"
+PUBLIC_ACCESS_BLOCK_KEYS = ("BlockPublicAcls", "IgnorePublicAcls", "BlockPublicPolicy", "RestrictPublicBuckets")
 
 """HELPER FUNCTIONS"""
 
@@ -93,12 +94,11 @@ def list_buckets_command(args: Dict[str, Any], aws_client: AWSClient) -> Command
         role_session_name=args.get("roleSessionName"),
         role_session_duration=args.get("roleSessionDuration"),
     )
-    data = []
     response = client.list_buckets()
-    for bucket in response["Buckets"]:
-        data.append(
-            {"BucketName": bucket["Name"], "CreationDate": datetime.strftime(bucket["CreationDate"], "%Y-%m-%dT%H:%M:%S")}
-        )
+    data = [
+        {"BucketName": bucket["Name"], "CreationDate": bucket["CreationDate"].strftime("%Y-%m-%dT%H:%M:%S")}
+        for bucket in response["Buckets"]
+    ]
     human_readable = tableToMarkdown("AWS S3 Buckets", data)
     return CommandResults(
         readable_output=human_readable, outputs_prefix="AWS.S3.Buckets", outputs_key_field="BucketName", outputs=data
@@ -249,12 +249,7 @@ def get_public_access_block(args: Dict[str, Any], aws_client: AWSClient) -> Comm
     public_access_block_configuration = response.get("PublicAccessBlockConfiguration")
     data = {
         "BucketName": args.get("bucket"),
-        "PublicAccessBlockConfiguration": {
-            "BlockPublicAcls": public_access_block_configuration.get("BlockPublicAcls"),
-            "IgnorePublicAcls": public_access_block_configuration.get("IgnorePublicAcls"),
-            "BlockPublicPolicy": public_access_block_configuration.get("BlockPublicPolicy"),
-            "RestrictPublicBuckets": public_access_block_configuration.get("RestrictPublicBuckets"),
-        },
+        "PublicAccessBlockConfiguration": {key: public_access_block_configuration.get(key) for key in PUBLIC_ACCESS_BLOCK_KEYS},
     }
     human_readable = tableToMarkdown("AWS S3 Bucket Public Access Block", data)
     return CommandResults(
@@ -272,12 +267,7 @@ def put_public_access_block(args: Dict[str, Any], aws_client: AWSClient) -> Comm
     )
     kwargs = {
         "Bucket": args.get("bucket"),
-        "PublicAccessBlockConfiguration": {
-            "BlockPublicAcls": argToBoolean(args.get("BlockPublicAcls")),
-            "IgnorePublicAcls": argToBoolean(args.get("IgnorePublicAcls")),
-            "BlockPublicPolicy": argToBoolean(args.get("BlockPublicPolicy")),
-            "RestrictPublicBuckets": argToBoolean(args.get("RestrictPublicBuckets")),
-        },
+        "PublicAccessBlockConfiguration": {key: argToBoolean(args[key]) for key in PUBLIC_ACCESS_BLOCK_KEYS if key in args},
     }
     response = client.put_public_access_block(**kwargs)
 
@@ -328,6 +318,20 @@ def main():  # pragma: no cover
     sts_endpoint_url = params.get("sts_endpoint_url") or None
     endpoint_url = params.get("endpoint_url") or None
 
+    commands = {
+        "aws-s3-create-bucket": create_bucket_command,
+        "aws-s3-delete-bucket": delete_bucket_command,
+        "aws-s3-list-buckets": list_buckets_command,
+        "aws-s3-get-bucket-policy": get_bucket_policy_command,
+        "aws-s3-put-bucket-policy": put_bucket_policy_command,
+        "aws-s3-delete-bucket-policy": delete_bucket_policy_command,
+        "aws-s3-list-bucket-objects": list_objects_command,
+        "aws-s3-upload-file": upload_file_command,
+        "aws-s3-get-public-access-block": get_public_access_block,
+        "aws-s3-put-public-access-block": put_public_access_block,
+        "aws-s3-get-bucket-encryption": get_bucket_encryption,
+    }
+
     try:
         command = demisto.command()
         validate_params(aws_default_region, aws_role_arn, aws_role_session_name, aws_access_key_id, aws_secret_access_key)
@@ -349,48 +353,18 @@ def main():  # pragma: no cover
 
         args = demisto.args()
 
-        demisto.info(f"Command being called is {demisto.command()}")
+        demisto.info(f"Command being called is {command}")
         if command == "test-module":
             client = aws_client.aws_session(service=SERVICE)
             response = client.list_buckets()
             if response["ResponseMetadata"]["HTTPStatusCode"] == HTTPStatus.OK:
                 demisto.results("ok")
 
-        elif command == "aws-s3-create-bucket":
-            return_results(create_bucket_command(args, aws_client))
-
-        elif command == "aws-s3-delete-bucket":
-            return_results(delete_bucket_command(args, aws_client))
-
-        elif command == "aws-s3-list-buckets":
-            return_results(list_buckets_command(args, aws_client))
-
-        elif command == "aws-s3-get-bucket-policy":
-            return_results(get_bucket_policy_command(args, aws_client))
-
-        elif command == "aws-s3-put-bucket-policy":
-            return_results(put_bucket_policy_command(args, aws_client))
-
-        elif command == "aws-s3-delete-bucket-policy":
-            return_results(delete_bucket_policy_command(args, aws_client))
-
         elif command == "aws-s3-download-file":
             download_file_command(args, aws_client)
 
-        elif command == "aws-s3-list-bucket-objects":
-            return_results(list_objects_command(args, aws_client))
-
-        elif command == "aws-s3-upload-file":
-            return_results(upload_file_command(args, aws_client))
-
-        elif command == "aws-s3-get-public-access-block":
-            return_results(get_public_access_block(args, aws_client))
-
-        elif command == "aws-s3-put-public-access-block":
-            return_results(put_public_access_block(args, aws_client))
-
-        elif command == "aws-s3-get-bucket-encryption":
-            return_results(get_bucket_encryption(args, aws_client))
+        elif command in commands:
+            return_results(commands[command](args, aws_client))
         else:
             raise NotImplementedError(f"{command} command is not implemented.")
 
@@ -318,6 +318,30 @@ def test_put_public_access_block_command(mocker, res, excepted):
     assert res.readable_output == f"{excepted} public access block to the {args.get('bucket')} bucket"
 
 
+def test_put_public_access_block_command_sends_only_given_settings(mocker):
+    """
+    Given:
+    - A bucket name and only some of the public access block settings.
+    When:
+    - Calling put_public_access_block method.
+    Then:
+    - Ensure that only the given settings are sent, converted to booleans.
+    """
+    args = {"bucket": "test_bucket", "BlockPublicAcls": "true", "RestrictPublicBuckets": "false"}
+    args.update(TEST_PARAMS)
+
+    mocker.patch.object(AWSClient, "aws_session", return_value=Boto3Client())
+    put_mock = mocker.patch.object(
+        Boto3Client, "put_public_access_block", return_value={"ResponseMetadata": {"HTTPStatusCode": HTTPStatus.OK}}
+    )
+
+    AWS_S3.put_public_access_block(args, AWSClient())
+    assert put_mock.call_args.kwargs["PublicAccessBlockConfiguration"] == {
+        "BlockPublicAcls": True,
+        "RestrictPublicBuckets": False,
+    }
+
+
 def test_get_bucket_encryption(mocker):
     """
     Given:
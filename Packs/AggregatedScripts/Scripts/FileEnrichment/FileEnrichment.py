@@ -5,6 +5,7 @@ from enum import Enum
 from typing import Any
 from collections import defaultdict
 from collections.abc import Callable
+from functools import cached_property
 
 """ CONSTANTS """
 
@@ -212,10 +213,11 @@ class Command:
 
         return entry_context, readable_command_results
 
-    @property
+    @cached_property
     def as_formatted_string(self) -> str:
         """
         Formats the command and its argument names and values.
+        The value is computed once, since the command is logged several times during its execution.
 
         Returns:
             str: A formatted string of the command name and its arguments.
@@ -94,6 +94,28 @@ def test_command_prepare_human_readable(original_human_readable: str, is_error:
     assert human_readable_command_results.readable_output == expected_readable_output
 
 
+def test_command_formatted_string_is_computed_once(mocker: MockerFixture):
+    """
+    Given:
+        - A Command object with a dictionary argument.
+
+    When:
+        - Converting the command to a string several times.
+
+    Assert:
+        - Ensure the formatted string is correct and the arguments are only serialized once.
+    """
+    command = Command("wildfire-upload-url", {"upload": "http://www.example.com", "extra": {"key": "value"}}, Brands.WILDFIRE_V2)
+    json_dumps_spy = mocker.spy(json, "dumps")
+
+    first_formatted = str(command)
+    second_formatted = repr(command)
+
+    assert first_formatted == '!wildfire-upload-url upload="http://www.example.com" extra="{\\\\"key\\\\": \\\\"value\\\\"}"'
+    assert second_formatted == f"Command: {first_formatted}"
+    assert json_dumps_spy.call_count == 1
+
+
 def test_command_execute(mocker: MockerFixture):
     """
     Given:
@@ -7,6 +7,8 @@ from CommonServerPython import *
 
 """ CONSTANTS """
 DEFAULT_TIMEOUT = 300
+INITIAL_POLLING_INTERVAL = 10  # The minimal interval allowed by ScheduledCommand.
+MAX_POLLING_INTERVAL = 60
 
 
 class Brands(StrEnum):
@@ -142,7 +144,11 @@ class Command:
         """
         demisto.debug(f"[Command] Executing: '{self.name}' with args: {self.args} for brand: {self.brand}")
         raw_response = demisto.executeCommand(self.name, self.args)
-        demisto.debug(f"[Command] Received response for '{self.name}'. Raw response: {raw_response}")
+        # Formatting the whole raw response is costly for large responses, so it is only done in debug mode.
+        if is_debug_mode():
+            demisto.debug(f"[Command] Received response for '{self.name}'. Raw response: {raw_response}")
+        else:
+            demisto.debug(f"[Command] Received {len(raw_response)} entries for '{self.name}'.")
 
         verbose_results = []
         for result in raw_response:
@@ -169,19 +175,12 @@ class Command:
         Returns:
             list[dict]: A list containing all non-empty entry context objects from the response.
         """
-        entry_contexts: list[dict] = []
-        for result in raw_response:
-            if is_error(result):
-                continue
-
-            # The EntryContext can be None or an empty dict/list. We only want populated ones.
-            if entry_context_item := result.get("EntryContext"):
-                if not entry_context_item:
-                    continue
-
-                entry_contexts.append(entry_context_item)
-
-        return entry_contexts
+        # The EntryContext can be None or an empty dict/list. We only want populated ones.
+        return [
+            entry_context_item
+            for result in raw_response
+            if not is_error(result) and (entry_context_item := result.get("EntryContext"))
+        ]
 
     @staticmethod
     def get_entry_context_object_containing_key(raw_response: list, key: str) -> Any:
@@ -363,16 +362,16 @@ class EndpointBrandMapper:
                 f"[EndpointBrandMapper] Error in get-endpoint-data command. "
                 f"Endpoints not found in any the response: {unprocessed_ids}"
             )
-            for endpoint_id in unprocessed_ids:
-                self.initial_results.append(
-                    QuarantineResult.create(
-                        endpoint_id=endpoint_id,
-                        status=QuarantineResult.Statuses.FAILED,
-                        message=QuarantineResult.Messages.ENDPOINT_NOT_FOUND,
-                        brand="Unknown",
-                        script_args=self.script_args,
-                    )
+            self.initial_results.extend(
+                QuarantineResult.create(
+                    endpoint_id=endpoint_id,
+                    status=QuarantineResult.Statuses.FAILED,
+                    message=QuarantineResult.Messages.ENDPOINT_NOT_FOUND,
+                    brand="Unknown",
+                    script_args=self.script_args,
                 )
+                for endpoint_id in unprocessed_ids
+            )
 
         demisto.debug(f"[EndpointBrandMapper] Processing complete. Found {len(online_endpoints)} online endpoints.")
         return online_endpoints
@@ -419,6 +418,11 @@ class XDRHandler(BrandHandler):
 
     CORE_COMMAND_PREFIX = "core"
     XDR_COMMAND_PREFIX = "xdr"
+    # Maps each supported brand to its command prefix and quarantine command name.
+    BRAND_COMMANDS = {
+        Brands.CORTEX_CORE_IR: (CORE_COMMAND_PREFIX, "core-quarantine-files"),
+        Brands.CORTEX_XDR_IR: (XDR_COMMAND_PREFIX, "xdr-file-quarantine"),
+    }
     QUARANTINE_STATUS_COMMAND = "get-quarantine-status"
     QUARANTINE_STATUS_SUCCESS = "COMPLETED_SUCCESSFULLY"
 
@@ -431,10 +435,10 @@ class XDRHandler(BrandHandler):
             orchestrator (QuarantineOrchestrator): The main orchestrator instance.
         """
         super().__init__(brand, orchestrator)
-        self.command_prefix = self.CORE_COMMAND_PREFIX if self.brand == Brands.CORTEX_CORE_IR else self.XDR_COMMAND_PREFIX
-        self.quarantine_command = (
-            "core-quarantine-files" if self.command_prefix == self.CORE_COMMAND_PREFIX else "xdr-file-quarantine"
+        self.command_prefix, self.quarantine_command = self.BRAND_COMMANDS.get(
+            self.brand, self.BRAND_COMMANDS[Brands.CORTEX_XDR_IR]
         )
+        self.quarantine_status_command = f"{self.command_prefix}-{self.QUARANTINE_STATUS_COMMAND}"
 
     def validate_args(self, args: dict) -> None:
         """
@@ -473,7 +477,7 @@ class XDRHandler(BrandHandler):
         """
         demisto.debug(f"[{self.brand} Handler] Checking quarantine status for endpoint {endpoint_id}.")
         status_cmd = Command(
-            name=f"{self.command_prefix}-{XDRHandler.QUARANTINE_STATUS_COMMAND}",
+            name=self.quarantine_status_command,
             args={"endpoint_id": endpoint_id, "file_hash": file_hash, "file_path": file_path},
             brand=self.brand,
         )
@@ -485,7 +489,7 @@ class XDRHandler(BrandHandler):
         if not status_context or not isinstance(status_context[0], dict):
             return {}
 
-        return list(status_context[0].values())[0]
+        return next(iter(status_context[0].values()))
 
     def _process_final_endpoint_status(self, endpoint_result: dict, job_data: dict) -> QuarantineResult:
         """
@@ -617,6 +621,33 @@ class XDRHandler(BrandHandler):
         demisto.debug(f"[{self.brand} Handler] Created new job object: {job}")
         return job
 
+    def _finalize_endpoint(self, quarantine_endpoint_result: dict, job: dict) -> QuarantineResult:
+        """
+        Wraps `_process_final_endpoint_status` so a failure on one endpoint results in a
+        failed QuarantineResult instead of aborting the whole job.
+
+        Args:
+            quarantine_endpoint_result (dict): The result object for a single endpoint from the polling command.
+            job (dict): The job object that has just completed polling.
+
+        Returns:
+            QuarantineResult: A structured result object for the endpoint.
+        """
+        try:
+            return self._process_final_endpoint_status(quarantine_endpoint_result, job)
+        except Exception as e:
+            demisto.error(
+                f"[{self.brand} Handler] Failed to get status of quarantine for endpoint:"
+                f" {quarantine_endpoint_result.get('endpoint_id')}: {e}"
+            )
+            return QuarantineResult.create(
+                endpoint_id=quarantine_endpoint_result.get("endpoint_id", "Unknown"),
+                status=QuarantineResult.Statuses.FAILED,
+                message=QuarantineResult.Messages.GENERAL_FAILURE,
+                brand=self.brand,
+                script_args=self.orchestrator.args,
+            )
+
     def finalize(self, job: dict, last_poll_response: list) -> list[QuarantineResult]:
         """
         Finalizes a completed quarantine job for the XDR brand.
@@ -633,31 +664,16 @@ class XDRHandler(BrandHandler):
             list[QuarantineResult]: A list of final QuarantineResult objects.
         """
         demisto.debug(f"[{self.brand} Handler] Finalizing job.")
-        final_results = []
 
         quarantine_endpoints_final_results: list = Command.get_entry_context_object_containing_key(
             last_poll_response, "GetActionStatus"
         )
 
         demisto.debug(f"[{self.brand} Handler] Finalizing endpoint results from job.")
-        for quarantine_endpoint_result in quarantine_endpoints_final_results:
-            try:
-                final_results.append(self._process_final_endpoint_status(quarantine_endpoint_result, job))
-            except Exception as e:
-                demisto.error(
-                    f"[{self.brand} Handler] Failed to get status of quarantine for endpoint:"
-                    f" {quarantine_endpoint_result.get('endpoint_id')}: {e}"
-                )
-                final_results.append(
-                    QuarantineResult.create(
-                        endpoint_id=quarantine_endpoint_result.get("endpoint_id", "Unknown"),
-                        status=QuarantineResult.Statuses.FAILED,
-                        message=QuarantineResult.Messages.GENERAL_FAILURE,
-                        brand=self.brand,
-                        script_args=self.orchestrator.args,
-                    )
-                )
-        return final_results
+        return [
+            self._finalize_endpoint(quarantine_endpoint_result, job)
+            for quarantine_endpoint_result in quarantine_endpoints_final_results
+        ]
 
 
 def handler_factory(brand: str, orchestrator) -> BrandHandler:
@@ -696,6 +712,8 @@ class QuarantineOrchestrator:
     FILE_HASH_ARG = "file_hash"
     FILE_PATH_ARG = "file_path"
     BRANDS_ARG = "brands"
+    POLLING_INTERVAL_ARG = "polling_interval"
+    NEXT_POLLING_INTERVAL_ARG = "next_polling_interval"
 
     HASH_TYPE_TO_BRANDS = {"sha256": [Brands.CORTEX_CORE_IR, Brands.CORTEX_XDR_IR]}
 
@@ -713,6 +731,7 @@ class QuarantineOrchestrator:
         self.args = args
         self.verbose = argToBoolean(args.get("verbose", False))
         self.verbose_results: list[CommandResults] = []
+        self.handlers: dict[str, BrandHandler] = {}
         demisto_context = demisto.context()
         self.pending_jobs = list(demisto.get(demisto_context, self.CONTEXT_PENDING_JOBS, []))
         # Load results from context, ensuring they are dictionaries
@@ -723,8 +742,9 @@ class QuarantineOrchestrator:
             f"[Orchestrator] Loaded state. Pending jobs: {len(self.pending_jobs)}, "
             f"Completed results: {len(self.completed_results)}"
         )
-        demisto.debug(f"[Orchestrator] Loaded pending jobs: {self.pending_jobs}")
-        demisto.debug(f"[Orchestrator] Loaded completed results: {self.completed_results}")
+        if is_debug_mode():
+            demisto.debug(f"[Orchestrator] Loaded pending jobs: {self.pending_jobs}")
+            demisto.debug(f"[Orchestrator] Loaded completed results: {self.completed_results}")
 
     def _verify_and_dedup_endpoint_ids(self):
         """
@@ -759,20 +779,24 @@ class QuarantineOrchestrator:
             QuarantineException: If an invalid brand is specified or no valid, enabled
                               integrations are found.
         """
-        user_given_brands: list = argToList(self.args.get(QuarantineOrchestrator.BRANDS_ARG))
+        user_given_brands = set(argToList(self.args.get(QuarantineOrchestrator.BRANDS_ARG)))
+        valid_brands = set(Brands.values())
 
         # Verify if brands are given, that they are ALL valid
-        for brand in user_given_brands:
-            if brand not in Brands.values():
-                raise QuarantineException(f"Invalid brand: {brand}. Valid brands are: {Brands.values()}")
-
-        enabled_brands = {module.get("brand") for module in demisto.getModules().values() if module.get("state") == "active"}
+        if invalid_brands := user_given_brands - valid_brands:
+            raise QuarantineException(f"Invalid brand: {', '.join(sorted(invalid_brands))}. Valid brands are: {Brands.values()}")
 
-        brands_to_consider = set(user_given_brands) if user_given_brands else set(Brands.values())
+        brands_to_consider = user_given_brands or valid_brands
 
         # The final list of brands to run on is the intersection of the brands we
-        # should consider and the brands that are actually enabled.
-        brands_to_run = list(brands_to_consider.intersection(enabled_brands))
+        # should consider and the brands that are actually enabled, collected in a single pass over the modules.
+        brands_to_run = list(
+            {
+                brand
+                for module in demisto.getModules().values()
+                if module.get("state") == "active" and (brand := module.get("brand")) in brands_to_consider
+            }
+        )
 
         if not brands_to_run:
             raise QuarantineException(
@@ -805,7 +829,7 @@ class QuarantineOrchestrator:
                 f"Unsupported hash type: {hash_type}. Supported types are: {', '.join(self.HASH_TYPE_TO_BRANDS.keys())}"
             )
 
-        if not any(brand in brands_to_run for brand in supported_brands_for_hash):
+        if set(supported_brands_for_hash).isdisjoint(brands_to_run):
             raise QuarantineException(
                 "Could not find enabled integrations for the requested hash type.\n"
                 f"For hash_type {hash_type.upper()} please use one of the following brands: "
@@ -834,6 +858,23 @@ class QuarantineOrchestrator:
 
         demisto.debug("[Orchestrator] Finished sanitizing and validating script arguments.")
 
+    def _get_handler(self, brand: str) -> BrandHandler:
+        """
+        Returns the handler for a brand, creating it on first use.
+
+        Handlers only hold brand-derived constants, so a single instance per brand
+        is shared by all the jobs of the current run.
+
+        Args:
+            brand (str): The name of the brand.
+
+        Returns:
+            BrandHandler: The handler for the brand.
+        """
+        if brand not in self.handlers:
+            self.handlers[brand] = handler_factory(brand, self)
+        return self.handlers[brand]
+
     def _is_first_run(self) -> bool:
         """
         Determines if this is the first execution of the script for this task.
@@ -855,13 +896,49 @@ class QuarantineOrchestrator:
         """
         return metadata.get("polling") is True
 
+    def _get_initial_polling_interval(self) -> int:
+        """
+        Returns the user-configured polling interval, falling back to INITIAL_POLLING_INTERVAL.
+
+        Values below INITIAL_POLLING_INTERVAL are raised to it, as ScheduledCommand
+        does not allow shorter intervals.
+
+        Returns:
+            int: The number of seconds to wait before the first polling run.
+        """
+        polling_interval = arg_to_number(self.args.get(self.POLLING_INTERVAL_ARG)) or INITIAL_POLLING_INTERVAL
+        return max(polling_interval, INITIAL_POLLING_INTERVAL)
+
+    def _get_next_polling_interval(self, made_progress: bool) -> int:
+        """
+        Calculates the delay before the next polling run using exponential backoff.
+
+        The interval starts at the configured polling interval and doubles on every polling run
+        that did not complete any job, up to MAX_POLLING_INTERVAL (or the configured interval,
+        if it is higher). Whenever a job completes while others are still pending, the interval
+        is reset so the remaining jobs are picked up quickly.
+
+        Args:
+            made_progress (bool): Whether any job completed (or was created) in the current run.
+
+        Returns:
+            int: The number of seconds to wait before the next polling run.
+        """
+        initial_interval = self._get_initial_polling_interval()
+        current_interval = arg_to_number(self.args.get(self.NEXT_POLLING_INTERVAL_ARG))
+        if made_progress or not current_interval:
+            return initial_interval
+
+        return min(current_interval * 2, max(MAX_POLLING_INTERVAL, initial_interval))
+
     def run(self) -> PollResult:
         """
         The main execution method for the orchestrator.
 
         It determines if this is the first run or a polling run and calls the
         appropriate methods (`_initiate_jobs` or `_check_pending_jobs`). At the end
-        of each cycle, it saves state and returns a PollResult to the XSOAR server.
+        of each cycle, it saves state and returns a PollResult to the XSOAR server,
+        with the interval for the next polling run stored in the next run's arguments.
 
         Returns:
             PollResult: An object indicating whether to continue polling or to finish
@@ -874,33 +951,30 @@ class QuarantineOrchestrator:
             try:
                 self._sanitize_and_validate_args()
             except Exception as e:
-                self.completed_results = []
-
-                for endpoint_id in argToList(self.args.get(self.ENDPOINT_IDS_ARG)):
-                    self.completed_results.append(
-                        QuarantineResult.create(
-                            endpoint_id,
-                            QuarantineResult.Statuses.FAILED,
-                            QuarantineResult.Messages.FAILED_WITH_REASON.format(reason=str(e)),
-                            "Unknown",
-                            {
-                                self.FILE_PATH_ARG: self.args.get(self.FILE_PATH_ARG),
-                                self.FILE_HASH_ARG: self.args.get(self.FILE_HASH_ARG),
-                            },
-                        )
-                    )
+                message = QuarantineResult.Messages.FAILED_WITH_REASON.format(reason=str(e))
+                script_args = {
+                    self.FILE_PATH_ARG: self.args.get(self.FILE_PATH_ARG),
+                    self.FILE_HASH_ARG: self.args.get(self.FILE_HASH_ARG),
+                }
+                self.completed_results = [
+                    QuarantineResult.create(endpoint_id, QuarantineResult.Statuses.FAILED, message, "Unknown", script_args)
+                    for endpoint_id in argToList(self.args.get(self.ENDPOINT_IDS_ARG))
+                ]
 
                 return self._get_final_results()
             self._initiate_jobs()
+            made_progress = True
         else:
             demisto.debug("[Orchestrator] Detected polling run.")
-            self._check_pending_jobs()
+            made_progress = self._check_pending_jobs()
 
         # After work is done, decide whether to continue polling or finish.
         if self.pending_jobs:
             demisto.debug(f"[Orchestrator] {len(self.pending_jobs)} jobs still pending. Saving state and scheduling next poll.")
             demisto.setContext(self.CONTEXT_PENDING_JOBS, self.pending_jobs)
             demisto.setContext(self.CONTEXT_COMPLETED_RESULTS, QuarantineResult.to_context_entry(self.completed_results))
+            self.args[self.NEXT_POLLING_INTERVAL_ARG] = self._get_next_polling_interval(made_progress)
+            demisto.debug(f"[Orchestrator] Next poll in {self.args[self.NEXT_POLLING_INTERVAL_ARG]} seconds.")
             interim_results = CommandResults(readable_output="Quarantine operations are still in progress...")
             return PollResult(
                 response=interim_results, continue_to_poll=True, args_for_next_run=self.args, partial_result=interim_results
@@ -942,7 +1016,7 @@ class QuarantineOrchestrator:
         """
         demisto.debug(f"[Orchestrator] Processing {len(endpoint_ids)} endpoints for brand '{brand}'.")
         try:
-            handler = handler_factory(brand, self)
+            handler = self._get_handler(brand)
             brand_args = self.args.copy()
             brand_args[self.ENDPOINT_IDS_ARG] = endpoint_ids
             handler.validate_args(brand_args)
@@ -961,24 +1035,27 @@ class QuarantineOrchestrator:
             demisto.error(f"Failed to process endpoints for brand '{brand}': {e}")
             error_msg = QuarantineResult.Messages.GENERAL_FAILURE
 
-        for endpoint_id in endpoint_ids:
-            self.completed_results.append(
-                QuarantineResult.create(
-                    endpoint_id=endpoint_id,
-                    status=QuarantineResult.Statuses.FAILED,
-                    message=error_msg,
-                    brand=brand,
-                    script_args=self.args,
-                )
+        self.completed_results.extend(
+            QuarantineResult.create(
+                endpoint_id=endpoint_id,
+                status=QuarantineResult.Statuses.FAILED,
+                message=error_msg,
+                brand=brand,
+                script_args=self.args,
             )
+            for endpoint_id in endpoint_ids
+        )
 
-    def _check_pending_jobs(self):
+    def _check_pending_jobs(self) -> bool:
         """
         Handles a polling run: checks the status of all pending jobs.
 
         For each job, it executes the polling command. If the job is still running,
         it is kept in the pending list. If it has finished, it is finalized, and
         the results are collected.
+
+        Returns:
+            bool: True if at least one job has finished in this run, False otherwise.
         """
         demisto.debug(f"[Orchestrator] Checking status of {len(self.pending_jobs)} pending jobs.")
         remaining_jobs = []
@@ -999,11 +1076,13 @@ class QuarantineOrchestrator:
                 remaining_jobs.append(job)
             else:
                 demisto.debug(f"[Orchestrator] Polling complete for job brand '{job['brand']}'. Finalizing.")
-                handler = handler_factory(job["brand"], self)
+                handler = self._get_handler(job["brand"])
                 final_results = handler.finalize(job, raw_response)
                 self.completed_results.extend(final_results)
 
+        made_progress = len(remaining_jobs) < len(self.pending_jobs)
         self.pending_jobs = remaining_jobs
+        return made_progress
 
     def _get_final_results(self) -> PollResult:
         """
@@ -1052,25 +1131,41 @@ class QuarantineOrchestrator:
 """ SCRIPT ENTRYPOINT """
 
 
-@polling_function(name="quarantine-file", timeout=arg_to_number(demisto.args().get("timeout", DEFAULT_TIMEOUT)))
-def quarantine_file_script(args: dict) -> PollResult:
+def quarantine_file_script(args: dict) -> CommandResults | list[CommandResults]:
     """
     Main polling script function that delegates all work to the Orchestrator.
 
-    This function is decorated with `@polling_function`, making it the entry point
-    for XSOAR's polling mechanism.
+    This function is the entry point for XSOAR's polling mechanism. Unlike `@polling_function`,
+    which schedules every run with a fixed interval, it schedules the next run with the
+    interval calculated by the orchestrator, so quick quarantine actions are picked up
+    early while long-running ones are polled less often.
 
     Args:
         args (dict): The arguments for the script execution.
 
     Returns:
-        PollResult: The result from the orchestrator's run.
+        CommandResults | list[CommandResults]: The final results, or the interim result with
+                                               the next polling run scheduled.
     """
     if not args:
         args = demisto.args()
 
     orchestrator = QuarantineOrchestrator(args)
-    return orchestrator.run()
+    poll_result = orchestrator.run()
+    if not poll_result.continue_to_poll:
+        return poll_result.response
+
+    ScheduledCommand.raise_error_if_not_supported()
+    poll_args = poll_result.args_for_next_run or args
+    poll_args["hide_polling_output"] = True
+    poll_response = poll_result.partial_result or CommandResults()
+    poll_response.scheduled_command = ScheduledCommand(
+        command="quarantine-file",
+        next_run_in_seconds=poll_args.get(QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG, INITIAL_POLLING_INTERVAL),
+        args=poll_args,
+        timeout_in_seconds=arg_to_number(args.get("timeout", DEFAULT_TIMEOUT)),
+    )
+    return poll_response
 
 
 def main():
@@ -1080,9 +1175,9 @@ def main():
     It sets up the arguments, calls the main polling function, and handles
     any top-level exceptions, returning an error to the user if one occurs.
     """
-    demisto.debug(f"Command being called is quarantine-file,  with arguments: {demisto.args()} ---")
+    args = demisto.args()
+    demisto.debug(f"Command being called is quarantine-file,  with arguments: {args} ---")
     try:
-        args = demisto.args()
         args["polling"] = True
         return_results(quarantine_file_script(args))
     except Exception as e:
@@ -1,5 +1,6 @@
 import pytest
 import demistomock as demisto  # noqa: F401
+from CommonServerPython import CommandResults, PollResult
 
 from QuarantineFile import (
     QuarantineException,
@@ -11,6 +12,9 @@ from QuarantineFile import (
     XDRHandler,
     Command,
     main,
+    quarantine_file_script,
+    INITIAL_POLLING_INTERVAL,
+    MAX_POLLING_INTERVAL,
 )
 
 SHA_256_HASH = "sha256sha256sha256sha256sha256sha256sha256sha256sha256sha256sha2"
@@ -188,6 +192,26 @@ class TestCommand:
         # Assert
         assert entry_context is None
 
+    @pytest.mark.parametrize("is_debug, should_log_raw_response", [(True, True), (False, False)])
+    def test_execute_logs_raw_response_only_in_debug_mode(self, mocker, is_debug, should_log_raw_response):
+        """
+        Given: A command whose execution returns a raw response.
+        When:  execute is called with debug mode enabled or disabled.
+        Then:  Ensure the raw response is only formatted into the debug log in debug mode.
+        """
+        # Arrange
+        raw_response = [{"Type": 1, "Contents": "very-large-raw-response"}]
+        mocker.patch.object(demisto, "executeCommand", return_value=raw_response)
+        mocker.patch("QuarantineFile.is_debug_mode", return_value=is_debug)
+        mock_debug = mocker.patch.object(demisto, "debug")
+
+        # Act
+        Command(name="some-command", args={}).execute()
+
+        # Assert
+        logged_messages = " ".join(call.args[0] for call in mock_debug.call_args_list)
+        assert ("very-large-raw-response" in logged_messages) is should_log_raw_response
+
 
 class TestEndpointBrandMapper:
     """
@@ -464,6 +488,23 @@ class TestBrandFactory:
             handler_factory("invalid-brand", orchestrator)
         assert "No handler available for brand: invalid-brand" in str(e.value)
 
+    def test_orchestrator_reuses_handler_per_brand(self, mocker):
+        """
+        Given: An orchestrator that needs the handler of the same brand more than once.
+        When: _get_handler is called repeatedly.
+        Then: handler_factory is only called once per brand.
+        """
+        orchestrator = _get_orchestrator({"endpoint_id": "any-id"})
+        factory_spy = mocker.patch("QuarantineFile.handler_factory", side_effect=handler_factory)
+
+        first_handler = orchestrator._get_handler(Brands.CORTEX_CORE_IR)
+        second_handler = orchestrator._get_handler(Brands.CORTEX_CORE_IR)
+        other_brand_handler = orchestrator._get_handler(Brands.CORTEX_XDR_IR)
+
+        assert first_handler is second_handler
+        assert other_brand_handler is not first_handler
+        assert factory_spy.call_count == 2
+
 
 class TestXDRHandler:
     def test_constructor_sets_correct_properties(self):
@@ -478,10 +519,12 @@ class TestXDRHandler:
         handler = XDRHandler(Brands.CORTEX_XDR_IR, orchestrator)
         assert handler.command_prefix == "xdr"
         assert handler.quarantine_command == "xdr-file-quarantine"
+        assert handler.quarantine_status_command == "xdr-get-quarantine-status"
 
         handler = XDRHandler(Brands.CORTEX_CORE_IR, orchestrator)
         assert handler.command_prefix == "core"
         assert handler.quarantine_command == "core-quarantine-files"
+        assert handler.quarantine_status_command == "core-get-quarantine-status"
 
     class TestPreProcessing:
         def test_validate_args_raises_exception_for_missing_file_path(self):
@@ -780,6 +823,46 @@ class TestXDRHandler:
             assert result.Message == QuarantineResult.Messages.FAILED_WITH_REASON.format(reason="Error from xdr agent")
             assert result.EndpointID == "ep2"
 
+        def test_finalize_many_endpoints_keeps_order(self, setup_finalize, mocker):
+            """
+            Given:
+                - The polling action completes for many endpoints.
+                - The final status check fails for one endpoint with an unexpected exception.
+            When:
+                - finalize is called.
+            Then:
+                - Ensure a status check is made for every successful endpoint.
+                - Ensure the results are returned in the same order as the polling results.
+                - Ensure the endpoint that raised gets a 'Failed' result without affecting the others.
+            """
+            # Arrange
+            handler, job = setup_finalize
+            endpoint_ids = [f"ep{i}" for i in range(20)]
+            mocker.patch(
+                "QuarantineFile.Command.get_entry_context_object_containing_key",
+                return_value=[
+                    {"action_id": 123, "endpoint_id": endpoint_id, "status": "COMPLETED_SUCCESSFULLY"}
+                    for endpoint_id in endpoint_ids
+                ],
+            )
+
+            def status_side_effect(endpoint_id, file_hash, file_path):
+                if endpoint_id == "ep7":
+                    raise Exception("some error")
+                return {"status": True}
+
+            handler._execute_quarantine_status_command.side_effect = status_side_effect
+
+            # Act
+            final_results = handler.finalize(job, [])
+
+            # Assert
+            assert handler._execute_quarantine_status_command.call_count == len(endpoint_ids)
+            assert [result.EndpointID for result in final_results] == endpoint_ids
+            assert final_results[7].Status == QuarantineResult.Statuses.FAILED
+            assert final_results[7].Message == QuarantineResult.Messages.GENERAL_FAILURE
+            assert all(result.Status == QuarantineResult.Statuses.SUCCESS for i, result in enumerate(final_results) if i != 7)
+
         def test_finalize_returns_failed_when_unexpected_exception(self, setup_finalize, mocker):
             """
             Given:
@@ -1288,6 +1371,89 @@ class TestQuarantineOrchestrator:
             assert orchestrator.completed_results[0].EndpointID == "ep1"
             assert not orchestrator.pending_jobs  # The list should now be empty
 
+        @pytest.mark.parametrize(
+            "current_interval, made_progress, expected_interval",
+            [
+                (None, False, INITIAL_POLLING_INTERVAL),
+                (INITIAL_POLLING_INTERVAL, False, INITIAL_POLLING_INTERVAL * 2),
+                (40, False, MAX_POLLING_INTERVAL),
+                (MAX_POLLING_INTERVAL, False, MAX_POLLING_INTERVAL),
+                (40, True, INITIAL_POLLING_INTERVAL),
+            ],
+        )
+        def test_get_next_polling_interval(self, current_interval, made_progress, expected_interval):
+            """
+            Given:
+                - The interval used for the current polling run.
+            When:
+                - _get_next_polling_interval is called.
+            Then:
+                - Ensure the interval doubles while no job completes, capped at MAX_POLLING_INTERVAL.
+                - Ensure the interval resets to INITIAL_POLLING_INTERVAL when a job completes.
+            """
+            args = {QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG: current_interval} if current_interval else {}
+            orchestrator = _get_orchestrator(args)
+
+            assert orchestrator._get_next_polling_interval(made_progress) == expected_interval
+
+        @pytest.mark.parametrize(
+            "polling_interval, current_interval, made_progress, expected_interval",
+            [
+                ("30", None, False, 30),
+                ("30", 30, False, MAX_POLLING_INTERVAL),
+                ("120", 120, False, 120),
+                ("120", 120, True, 120),
+                ("5", None, True, INITIAL_POLLING_INTERVAL),
+            ],
+        )
+        def test_get_next_polling_interval_with_configured_interval(
+            self, polling_interval, current_interval, made_progress, expected_interval
+        ):
+            """
+            Given:
+                - A user-configured polling_interval argument and the interval used for the current polling run.
+            When:
+                - _get_next_polling_interval is called.
+            Then:
+                - Ensure the configured interval is used as the starting point of the backoff.
+                - Ensure a configured interval below the ScheduledCommand minimum is raised to INITIAL_POLLING_INTERVAL.
+            """
+            args = {QuarantineOrchestrator.POLLING_INTERVAL_ARG: polling_interval}
+            if current_interval:
+                args[QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG] = current_interval
+            orchestrator = _get_orchestrator(args)
+
+            assert orchestrator._get_next_polling_interval(made_progress) == expected_interval
+
+        def test_run_polling_run_job_still_polling_backs_off(self, mocker):
+            """
+            Given:
+                - A polling run with a pending job in the context, polled after INITIAL_POLLING_INTERVAL seconds.
+                - The polling command indicates the action is still in progress.
+            When:
+                - The orchestrator's run() method is called.
+            Then:
+                - Ensure the interval for the next polling run is doubled.
+            """
+            # Arrange
+            args = {
+                "file_hash": "hash123",
+                "file_path": "/path",
+                QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG: INITIAL_POLLING_INTERVAL,
+            }
+            pending_job = {"brand": Brands.CORTEX_CORE_IR, "poll_command": "some-poll-cmd", "poll_args": {"action_id": "123"}}
+            mocker.patch.object(demisto, "context", return_value={QuarantineOrchestrator.CONTEXT_PENDING_JOBS: [pending_job]})
+            mocker.patch.object(demisto, "setContext")
+            polling_response = [{"Type": 1, "Contents": {}, "Metadata": {"polling": True, "pollingArgs": {"action_id": "456"}}}]
+            mocker.patch.object(demisto, "executeCommand", return_value=polling_response)
+
+            # Act
+            result = _get_orchestrator(args).run()
+
+            # Assert
+            assert result.continue_to_poll is True
+            assert result.args_for_next_run[QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG] == INITIAL_POLLING_INTERVAL * 2
+
 
 class TestScriptEntrypoints:
     """
@@ -1319,6 +1485,60 @@ class TestScriptEntrypoints:
         mock_script_func.assert_called_once_with(expected_args)
         mock_return_results.assert_called_once_with("SUCCESS")
 
+    def test_quarantine_file_script_schedules_next_run_with_orchestrator_interval(self, mocker):
+        """
+        Given:
+            - The orchestrator returns a PollResult that should continue polling.
+        When:
+            - quarantine_file_script is called.
+        Then:
+            - Ensure the next run is scheduled with the interval set by the orchestrator.
+            - Ensure the timeout argument is used as the polling timeout.
+        """
+        # Arrange
+        args = {"endpoint_id": "ep1", "file_hash": "hash123", "timeout": "600"}
+        interim_results = CommandResults(readable_output="Quarantine operations are still in progress...")
+        next_run_args = args | {QuarantineOrchestrator.NEXT_POLLING_INTERVAL_ARG: 20}
+        mocker.patch.object(
+            QuarantineOrchestrator,
+            "run",
+            return_value=PollResult(
+                response=interim_results, continue_to_poll=True, args_for_next_run=next_run_args, partial_result=interim_results
+            ),
+        )
+        mocker.patch("QuarantineFile.ScheduledCommand.raise_error_if_not_supported")
+
+        # Act
+        result = quarantine_file_script(args)
+
+        # Assert
+        assert result is interim_results
+        assert result.scheduled_command._next_run == "20"
+        assert result.scheduled_command._timeout == "600"
+        assert result.scheduled_command._args["hide_polling_output"] is True
+
+    def test_quarantine_file_script_returns_final_response(self, mocker):
+        """
+        Given:
+            - The orchestrator returns a PollResult that should not continue polling.
+        When:
+            - quarantine_file_script is called.
+        Then:
+            - Ensure the final response is returned without a scheduled command.
+        """
+        # Arrange
+        final_results = CommandResults(readable_output="done")
+        mocker.patch.object(
+            QuarantineOrchestrator, "run", return_value=PollResult(response=final_results, continue_to_poll=False)
+        )
+
+        # Act
+        result = quarantine_file_script({"endpoint_id": "ep1", "file_hash": "hash123"})
+
+        # Assert
+        assert result is final_results
+        assert result.scheduled_command is None
+
     def test_main_function_exception_path_cleans_up_context(self, mocker):
         """
         Given:
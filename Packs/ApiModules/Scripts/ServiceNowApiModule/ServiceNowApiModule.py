@@ -1,3 +1,5 @@
+import time
+
 from CommonServerPython import *
 
 from CommonServerUserPython import *
@@ -33,6 +35,8 @@ class ServiceNowClient(BaseClient):
         self.auth = None
         self.use_oauth = use_oauth
         self.jwt: Optional[str] = None
+        # The access token and its expiry time, kept in memory to avoid reading the integration context on every request.
+        self._access_token_cache: Optional[tuple[str, int]] = None
         if self.use_oauth:  # if user selected the `Use OAuth` box use OAuth authorization, else use basic authorization
             self.client_id = client_id
             self.client_secret = client_secret
@@ -69,43 +73,43 @@ class ServiceNowClient(BaseClient):
         ok_codes = (200, 201, 401)  # includes responses that are ok (200) and error responses that should be
         # handled by the client and not in the BaseClient
         try:
-            if self.use_oauth:  # add a valid access token to the headers when using OAuth
-                access_token = self.get_access_token()
-                self._headers.update({"Authorization": "Bearer " + access_token})
-            res = super()._http_request(
-                method=method,
-                url_suffix=url_suffix,
-                full_url=full_url,
-                resp_type="response",
-                headers=headers,
-                json_data=json_data,
-                params=params,
-                data=data,
-                files=files,
-                ok_codes=ok_codes,
-                return_empty_response=return_empty_response,
-                auth=auth,
-                timeout=timeout,
-            )
-            if res.status_code in [200, 201]:
-                try:
-                    return res.json()
-                except ValueError as exception:
-                    raise DemistoException(f"Failed to parse json object from response: {res.content}", exception)
-
-            if res.status_code in [401]:
-                if self.use_oauth:
-                    if demisto.getIntegrationContext().get("expiry_time", 0) <= date_to_timestamp(datetime.now()):
-                        access_token = self.get_access_token()
-                        self._headers.update({"Authorization": "Bearer " + access_token})
-                        return self.http_request(method, url_suffix, full_url=full_url, params=params)
+            # A request that fails with 401 because the access token has expired is retried once with a new token
+            for attempt in range(2):
+                if self.use_oauth:  # add a valid access token to the headers when using OAuth
+                    access_token = self.get_access_token()
+                    self._headers.update({"Authorization": "Bearer " + access_token})
+                res = super()._http_request(
+                    method=method,
+                    url_suffix=url_suffix,
+                    full_url=full_url,
+                    resp_type="response",
+                    headers=headers,
+                    json_data=json_data,
+                    params=params,
+                    data=data,
+                    files=files,
+                    ok_codes=ok_codes,
+                    return_empty_response=return_empty_response,
+                    auth=auth,
+                    timeout=timeout,
+                )
+                if res.status_code in [200, 201]:
                     try:
-                        err_msg = f"Unauthorized request: \n{res.json()!s}"
-                    except ValueError:
-                        err_msg = f"Unauthorized request: \n{res!s}"
-                    raise DemistoException(err_msg)
-                else:
-                    raise Exception(f"Authorization failed. Please verify that the username and password are correct.\n{res}")
+                        return res.json()
+                    except ValueError as exception:
+                        raise DemistoException(f"Failed to parse json object from response: {res.content}", exception)
+
+                if res.status_code in [401]:
+                    if self.use_oauth:
+                        if attempt == 0 and demisto.getIntegrationContext().get("expiry_time", 0) <= int(time.time() * 1000):
+                            continue
+                        try:
+                            err_msg = f"Unauthorized request: \n{res.json()!s}"
+                        except ValueError:
+                            err_msg = f"Unauthorized request: \n{res!s}"
+                        raise DemistoException(err_msg)
+                    else:
+                        raise Exception(f"Authorization failed. Please verify that the username and password are correct.\n{res}")
 
         except Exception as e:
             if self._verify and "SSL Certificate Verification Failed" in e.args[0]:
@@ -141,6 +145,8 @@ class ServiceNowClient(BaseClient):
             if res.get("refresh_token"):
                 refresh_token = {"refresh_token": res.get("refresh_token")}
                 set_integration_context(refresh_token)
+                # the stored access token was dropped, so the in-memory copy must not be used either
+                self._access_token_cache = None
         except Exception as e:
             return_error(
                 f"Login failed. Please check the instance configuration and the given username and password.\n{e.args[0]}"
@@ -151,11 +157,16 @@ class ServiceNowClient(BaseClient):
         Get an access token that was previously created if it is still valid, else, generate a new access token from
         the client id, client secret and refresh token.
         """
+        now = int(time.time() * 1000)
+        if self._access_token_cache and self._access_token_cache[1] > now:
+            return self._access_token_cache[0]
+
         ok_codes = (200, 201, 401)
         previous_token = get_integration_context()
 
         # Check if there is an existing valid access token
-        if previous_token.get("access_token") and previous_token.get("expiry_time") > date_to_timestamp(datetime.now()):
+        if previous_token.get("access_token") and previous_token.get("expiry_time", 0) > now:
+            self._access_token_cache = (previous_token["access_token"], previous_token["expiry_time"])
             return previous_token.get("access_token")
         else:
             data = {"client_id": self.client_id, "client_secret": self.client_secret}
@@ -189,14 +200,14 @@ class ServiceNowClient(BaseClient):
                         f"might have expired.\n{res}"
                     )
                 if res.get("access_token"):
-                    expiry_time = date_to_timestamp(datetime.now(), date_format="%Y-%m-%dT%H:%M:%S")
-                    expiry_time += res.get("expires_in", 0) * 1000 - 10
+                    expiry_time = int(time.time() * 1000) + res.get("expires_in", 0) * 1000 - 10
                     new_token = {
                         "access_token": res.get("access_token"),
                         "refresh_token": res.get("refresh_token"),
                         "expiry_time": expiry_time,
                     }
                     set_integration_context(new_token)
+                    self._access_token_cache = (res["access_token"], expiry_time)
                     return res.get("access_token")
             except Exception as e:
                 return_error(
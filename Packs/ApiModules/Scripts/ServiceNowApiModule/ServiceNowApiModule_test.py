@@ -35,7 +35,7 @@ def test_get_access_token(mocker):
     new_token_response._content = b'{"access_token": "new_token", "refresh_token": "refresh_token", "expires_in": 1}'
     new_token_response.status_code = 200
 
-    mocker.patch("ServiceNowApiModule.date_to_timestamp", return_value=0)
+    mocker.patch.object(time, "time", return_value=0)
     client = ServiceNowClient(
         credentials=PARAMS.get("credentials", {}),
         use_oauth=True,
@@ -52,11 +52,13 @@ def test_get_access_token(mocker):
     assert client.get_access_token() == "previous_token"
 
     # Validate that a new access token is returned when the previous has expired
+    client._access_token_cache = None
     mocker.patch.object(demisto, "getIntegrationContext", return_value=expired_access_token)
     mocker.patch.object(BaseClient, "_http_request", return_value=new_token_response)
     assert client.get_access_token() == "new_token"
 
     # Validate that an error is returned in case the user didn't run the login command first
+    client._access_token_cache = None
     mocker.patch.object(demisto, "getIntegrationContext", return_value={})
     try:
         client.get_access_token()
@@ -64,6 +66,68 @@ def test_get_access_token(mocker):
         assert "Could not create an access token" in e.args[0]
 
 
+def test_get_access_token_uses_in_memory_token(mocker):
+    """Unit test
+    Given
+    - A client using OAuth authorization that already obtained a valid access token.
+    When
+    - Calling the get_access_token function again.
+    Then
+    - Validate that the same access token is returned without reading the integration context again.
+    """
+    mocker.patch.object(time, "time", return_value=0)
+    get_context_mock = mocker.patch.object(
+        demisto,
+        "getIntegrationContext",
+        return_value={"access_token": "previous_token", "refresh_token": "refresh_token", "expiry_time": 1},
+    )
+    client = ServiceNowClient(
+        credentials=PARAMS.get("credentials", {}),
+        use_oauth=True,
+        client_id=PARAMS.get("client_id", ""),
+        client_secret=PARAMS.get("client_secret", ""),
+        url=PARAMS.get("url", ""),
+        verify=PARAMS.get("insecure", False),
+        proxy=PARAMS.get("proxy", False),
+        headers=PARAMS.get("headers", ""),
+    )
+
+    assert client.get_access_token() == "previous_token"
+    assert client.get_access_token() == "previous_token"
+    assert get_context_mock.call_count == 1
+
+
+def test_login_drops_in_memory_token(mocker):
+    """Unit test
+    Given
+    - A client using OAuth authorization that already obtained a valid access token.
+    When
+    - Calling the login function, which stores only a new refresh token in the integration context.
+    Then
+    - Validate that the in-memory access token is dropped as well.
+    """
+    client = ServiceNowClient(
+        credentials=PARAMS.get("credentials", {}),
+        use_oauth=True,
+        client_id=PARAMS.get("client_id", ""),
+        client_secret=PARAMS.get("client_secret", ""),
+        url=PARAMS.get("url", ""),
+        verify=PARAMS.get("insecure", False),
+        proxy=PARAMS.get("proxy", False),
+        headers=PARAMS.get("headers", ""),
+    )
+    client._access_token_cache = ("previous_token", 10**15)
+    response = mocker.MagicMock()
+    response.json.return_value = {"refresh_token": "new_refresh_token"}
+    mocker.patch.object(BaseClient, "_http_request", return_value=response)
+    set_context_mock = mocker.patch("ServiceNowApiModule.set_integration_context")
+
+    client.login("username", "password")
+
+    set_context_mock.assert_called_once_with({"refresh_token": "new_refresh_token"})
+    assert client._access_token_cache is None
+
+
 def test_separate_client_id_and_refresh_token():
     """Unit test
     Given
@@ -86,3 +150,41 @@ def test_separate_client_id_and_refresh_token():
         headers=PARAMS.get("headers", ""),
     )
     assert client.client_id == "client_id"
+
+
+def test_http_request_retries_once_with_the_same_body_on_expired_token(mocker):
+    """Unit test
+    Given
+    - A client using OAuth authorization whose access token expired while sending a request.
+    When
+    - Calling the http_request function with a JSON body, and the first attempt returns 401.
+    Then
+    - Validate that the request is retried exactly once, with a new access token and the same body.
+    """
+    from requests.models import Response
+
+    unauthorized_response = Response()
+    unauthorized_response._content = b'{"error": "token expired"}'
+    unauthorized_response.status_code = 401
+    ok_response = Response()
+    ok_response._content = b'{"result": "ok"}'
+    ok_response.status_code = 200
+
+    mocker.patch.object(demisto, "getIntegrationContext", return_value={"expiry_time": 0})
+    client = ServiceNowClient(
+        credentials=PARAMS.get("credentials", {}),
+        use_oauth=True,
+        client_id=PARAMS.get("client_id", ""),
+        client_secret=PARAMS.get("client_secret", ""),
+        url=PARAMS.get("url", ""),
+        verify=PARAMS.get("insecure", False),
+        proxy=PARAMS.get("proxy", False),
+        headers={},
+    )
+    mocker.patch.object(client, "get_access_token", side_effect=["expired_token", "new_token"])
+    http_request_mock = mocker.patch.object(BaseClient, "_http_request", side_effect=[unauthorized_response, ok_response])
+
+    assert client.http_request("POST", "/table/incident", json_data={"short_description": "test"}) == {"result": "ok"}
+    assert http_request_mock.call_count == 2
+    assert http_request_mock.call_args.kwargs["json_data"] == {"short_description": "test"}
+    assert client._headers["Authorization"] == "Bearer new_token"
@@ -145,7 +145,7 @@ def is_execution_time_exceeded(start_time: datetime) -> bool:
         bool: true, if execution passed timeout settings, false otherwise.
     """
     end_time = datetime.utcnow()
-    secs_from_beginning = (end_time - start_time).seconds
+    secs_from_beginning = (end_time - start_time).total_seconds()
     demisto.debug(f"Execution length so far is {secs_from_beginning} secs")
 
     return secs_from_beginning > EXECUTION_TIMEOUT_SECONDS
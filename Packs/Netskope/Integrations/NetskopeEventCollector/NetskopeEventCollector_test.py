@@ -293,6 +293,30 @@ def test_fix_last_run(last_run, supported_event_types, expected_result):
     assert last_run == expected_result
 
 
+@pytest.mark.parametrize(
+    "elapsed, expected_result",
+    [
+        ({"seconds": 10}, False),
+        ({"seconds": 200}, True),
+        ({"days": 1, "seconds": 10}, True),
+    ],
+)
+def test_is_execution_time_exceeded(elapsed, expected_result):
+    """
+    Given:
+        - An execution start time that is some time in the past, including more than a day ago.
+    When:
+        - Checking whether the execution timeout was exceeded.
+    Then:
+        - Make sure the whole elapsed duration is compared to the timeout, not only its seconds component.
+    """
+    from datetime import datetime, timedelta
+
+    from NetskopeEventCollector import is_execution_time_exceeded
+
+    assert is_execution_time_exceeded(datetime.utcnow() - timedelta(**elapsed)) is expected_result
+
+
 def test_incident_endpoint(mocker):
     """
     Given:
@@ -2,7 +2,10 @@ from itertools import chain
 from aiohttp import ClientResponseError
 import asyncio
 import aiohttp
+import math
 import traceback
+from datetime import UTC
+from email.utils import parsedate_to_datetime
 
 import demistomock as demisto
 import urllib3
@@ -14,6 +17,7 @@ urllib3.disable_warnings()  # pylint: disable=no-member
 """ CONSTANTS """
 
 ALL_SUPPORTED_EVENT_TYPES = ["application", "alert", "page", "audit", "network", "incident"]
+SUPPORTED_EVENT_TYPES_SET = frozenset(ALL_SUPPORTED_EVENT_TYPES)
 MAX_EVENTS_PAGE_SIZE = 10000
 MAX_RETRY = 3
 NETSKOPE_SEMAPHORE_COUNT = 4
@@ -22,9 +26,11 @@ MAX_FAILURE_ENTRIES_TO_HANDLE_PER_TYPE = 10
 # Netskope response constants
 RATE_LIMIT_REMAINING = "ratelimit-remaining"  # Rate limit remaining
 RATE_LIMIT_RESET = "ratelimit-reset"  # Rate limit RESET value is in seconds
+RETRY_AFTER = "Retry-After"  # Seconds (or an HTTP date) to wait before retrying a rate limited request
 VENDOR = "netskope"
 PRODUCT = "netskope"
 XSIAM_SEM = asyncio.Semaphore(20)
+EVENT_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
 
 # Event type configuration mapping
 # Each event type can have specific endpoint, time parameters, and count field configurations
@@ -184,7 +190,8 @@ def populate_parsing_rule_fields(event: dict, event_type: str):
     """
     event["source_log_event"] = event_type
     try:
-        event["_time"] = timestamp_to_datestring(event["timestamp"] * 1000, is_utc=True)
+        # the timestamp is in seconds, so it is formatted directly rather than through timestamp_to_datestring
+        event["_time"] = datetime.fromtimestamp(event["timestamp"], UTC).strftime(EVENT_TIME_FORMAT)
     except (TypeError, KeyError):
         # modeling rule will default on ingestion time if _time is missing
         pass
@@ -220,14 +227,9 @@ def handle_event_types_to_fetch(event_types_to_fetch) -> list[str]:
 
 
 def remove_unsupported_event_types(last_run_dict: dict, event_types_to_fetch: list):
-    keys_to_remove = []
-
-    for key in last_run_dict:
-        if (key in ALL_SUPPORTED_EVENT_TYPES) and (key not in event_types_to_fetch):
-            keys_to_remove.append(key)
-
-    for key in keys_to_remove:
-        last_run_dict.pop(key, None)
+    for key in list(last_run_dict):
+        if (key in SUPPORTED_EVENT_TYPES_SET) and (key not in event_types_to_fetch):
+            del last_run_dict[key]
 
 
 def get_time_window_params(event_type: str, start_time: str, end_time: str) -> dict:
@@ -270,7 +272,9 @@ def handle_errors(failures):
     return failures_res
 
 
-def handle_prev_fetch_failures(client: Client, last_run: dict, event_type: str, send_to_xsiam: bool, coord_id: str):
+def handle_prev_fetch_failures(
+    client: Client, last_run: dict, event_type: str, send_to_xsiam: bool, coord_id: str, keep_events: bool = True
+):
     tasks = []
     failure_data = demisto.get(last_run, f"{event_type}.failures", defaultParam=[])
     if failure_data:
@@ -286,6 +290,7 @@ def handle_prev_fetch_failures(client: Client, last_run: dict, event_type: str,
                     send_to_xsiam=send_to_xsiam,
                     coord_id=coord_id,
                     is_re_fetch_failed_fetch=True,
+                    keep_events=keep_events,
                     **failure_entry,
                 )
             )
@@ -321,6 +326,30 @@ async def honor_rate_limiting_async(headers, event_type, params) -> bool:
     return False
 
 
+async def wait_before_rate_limit_retry_async(headers, event_type, params, retry_count: int):
+    """
+    Waits before retrying a request that was rejected with 429 (rate limit).
+    The rate limit headers are honored if present, otherwise the Retry-After header is used (either as seconds or as an
+    HTTP date), and if it is missing or invalid, an exponential backoff based on the retry count.
+    """
+    headers = headers or {}
+    if await honor_rate_limiting_async(headers, event_type, params):
+        return
+
+    to_sleep = 2**retry_count
+    if retry_after := headers.get(RETRY_AFTER):
+        try:
+            to_sleep = int(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                to_sleep = max(math.ceil((retry_at - datetime.now(UTC)).total_seconds()), 0)
+            except (TypeError, ValueError):
+                demisto.debug(f"Could not parse the {RETRY_AFTER} header value {retry_after}, using exponential backoff")
+    demisto.debug(f"Rate limited for {event_type=} and {params=}, going to async sleep for {to_sleep} seconds before retrying")
+    await asyncio.sleep(to_sleep)
+
+
 async def handle_event_type_async(
     client: Client,
     event_type: str,
@@ -331,6 +360,7 @@ async def handle_event_type_async(
     send_to_xsiam: bool,
     coord_id: str,
     is_re_fetch_failed_fetch: bool = False,
+    keep_events: bool = True,
 ) -> tuple[str, dict]:
     page_size = min(limit, MAX_EVENTS_PAGE_SIZE)
     params = assign_params(limit=page_size, offset=offset, **get_time_window_params(event_type, start_time, end_time))
@@ -342,7 +372,7 @@ async def handle_event_type_async(
 
     demisto.debug(f"[{coord_id}] Starting fetch_and_send_events_async")
     success_res, failures = await fetch_and_send_events_async(
-        client, event_type, params, limit, send_to_xsiam, is_re_fetch_failed_fetch
+        client, event_type, params, limit, send_to_xsiam, is_re_fetch_failed_fetch, keep_events
     )
     demisto.debug(f"[{coord_id}] Completed fetch_and_send_events_async - success: {len(success_res)}, failures: {len(failures)}")
 
@@ -381,41 +411,57 @@ async def handle_event_type_async(
         demisto.error(msg)
         raise DemistoException(msg, exception=failures[0])
     failures_data = handle_errors(failures)
-    events = list(chain.from_iterable(success_res))
+    events_count = sum(page_events_count for page_events_count, _ in success_res)
+    events = list(chain.from_iterable(page_events for _, page_events in success_res))
 
-    res_dict = {"events": events, "failures": failures_data}
-    demisto.debug(f"[{coord_id}] Fetched {len(events)} {event_type} events")
+    res_dict = {"events": events, "events_count": events_count, "failures": failures_data}
+    demisto.debug(f"[{coord_id}] Fetched {events_count} {event_type} events")
     if not is_re_fetch_failed_fetch:
         # if we are retrying a failed fetch (is_re_fetch_failed_fetch=True)
         # no additional info is needed, as we are only trying to fetch the same chunk again.
-        if len(events) == limit:
+        if events_count == limit:
             # meaning, there may be another events to fetch for the current time "window"
             # save the start_time and end_time and the next offset
 
             next_fetch_data = {
                 "next_fetch_start_time": start_time,
                 "next_fetch_end_time": end_time,
-                "next_fetch_offset": offset + len(events),
+                "next_fetch_offset": offset + events_count,
             }
             demisto.debug(
-                f"[{coord_id}] fetched {(len(events) == limit)=}, need to store the time window and offset "
+                f"[{coord_id}] fetched {(events_count == limit)=}, need to store the time window and offset "
                 f"for next fetch, {next_fetch_data=}"
             )
             res_dict |= next_fetch_data
         else:
             res_dict |= {"next_fetch_start_time": end_time}
 
-    demisto.debug(f"[{coord_id}] Completed event_type processing, returning {len(events)} events")
+    demisto.debug(f"[{coord_id}] Completed event_type processing, returning {events_count} events")
     return event_type, res_dict
 
 
 async def fetch_and_send_events_async(
-    client: Client, type: str, request_params: dict, limit: int, send_to_xsiam: bool, is_re_fetch_failed_fetch: bool = False
+    client: Client,
+    type: str,
+    request_params: dict,
+    limit: int,
+    send_to_xsiam: bool,
+    is_re_fetch_failed_fetch: bool = False,
+    keep_events: bool = True,
 ) -> tuple[list, list]:
-    async def _handle_page(params):
+    """
+    Fetches all the pages of the given event type concurrently, and sends each page to XSIAM as soon as it arrives.
+
+    Returns:
+        list: For each successful page, a tuple of its events count and its events.
+              The events are dropped once sent when keep_events is False, so pages are not held in memory until the end.
+        list: The exceptions of the failed pages.
+    """
+
+    async def _handle_page(params) -> tuple[int, list]:
         async def _fetch_page():
             retry_count = 0
-            while retry_count < MAX_RETRY:
+            while True:
                 try:
                     if retry_count > 0:
                         # in retry
@@ -429,12 +475,12 @@ async def fetch_and_send_events_async(
                 except ClientResponseError as e:
                     if e.status != 429:  # not rate limit
                         raise e
-                    if await honor_rate_limiting_async(e.headers, type, params):
-                        retry_count += 1
-                    else:
+                    if retry_count + 1 >= MAX_RETRY:
+                        # raise so the page is kept as a failure and re-fetched, instead of being skipped as empty
+                        demisto.debug(f"Rate limit (429) occurred on attempt {retry_count + 1} out of {MAX_RETRY=}, giving up")
                         raise e
-            demisto.debug(f"Rate limit (429) occurred and {retry_count=} reached the {MAX_RETRY=}")
-            return {}
+                    await wait_before_rate_limit_retry_async(e.headers, type, params, retry_count)
+                    retry_count += 1
 
         async def _send_page_to_xsiam(events):
             async with XSIAM_SEM:
@@ -451,7 +497,7 @@ async def fetch_and_send_events_async(
                 await _send_page_to_xsiam(events)
         except Exception as e:
             raise DemistoException(message=str(e), exception=e, res=params)
-        return events
+        return len(events), events if keep_events else []
 
     async def _handle_all_pages():
         try:
@@ -481,7 +527,7 @@ async def fetch_and_send_events_async(
             raise DemistoException(message=str(e), exception=e, res=request_params)
 
     try:
-        results: list[list[dict] | BaseException] = await _handle_all_pages()
+        results: list[tuple[int, list[dict]] | BaseException] = await _handle_all_pages()
         success_tasks = list(filter(lambda res: not isinstance(res, BaseException), results))
         failures = list(filter(lambda res: isinstance(res, BaseException), results))
         return success_tasks, failures
@@ -493,8 +539,8 @@ async def fetch_and_send_events_async(
 
 
 async def handle_fetch_and_send_all_events(
-    client: Client, last_run: dict, limit: int = MAX_EVENTS_PAGE_SIZE, send_to_xsiam=False
-) -> tuple[list[dict], dict]:
+    client: Client, last_run: dict, limit: int = MAX_EVENTS_PAGE_SIZE, send_to_xsiam=False, keep_events: bool = True
+) -> tuple[list[dict], dict, int]:
     """
     Iterates over all supported event types and call the handle event fetch logic and send the events to XSIAM.
 
@@ -509,10 +555,12 @@ async def handle_fetch_and_send_all_events(
         last_run (dict): The execution last run dict where the relevant operations are stored.
         limit (int): The limit which after we stop pulling.
         send_to_xsiam(bool): Whether to send the fetched events to XSIAM or not.
+        keep_events(bool): Whether to return the fetched events. When False, each page is released once sent to XSIAM.
 
     Returns:
-        list: The accumulated list of all events.
+        list: The accumulated list of all events (empty when keep_events is False).
         dict: The updated last_run object.
+        int: The number of fetched events.
     """
     start = time.time()
     # needed as we use concurrent async tasks
@@ -521,6 +569,7 @@ async def handle_fetch_and_send_all_events(
     remove_unsupported_event_types(last_run, client.event_types_to_fetch)
 
     all_events = []
+    events_count = 0
     epoch_current_time = str(int(arg_to_datetime("now").timestamp()))  # type: ignore[union-attr]
     epoch_last_day = str(int(arg_to_datetime("1 day").timestamp()))  # type: ignore[union-attr]
     page_size = min(limit, MAX_EVENTS_PAGE_SIZE)
@@ -538,14 +587,18 @@ async def handle_fetch_and_send_all_events(
 
         demisto.debug(f"[{coord_id}] Processing event type: {event_type}")
         # get failures from previous iteration
-        prev_fetch_failure_tasks.extend(handle_prev_fetch_failures(client, last_run, event_type, send_to_xsiam, coord_id))
+        prev_fetch_failure_tasks.extend(
+            handle_prev_fetch_failures(client, last_run, event_type, send_to_xsiam, coord_id, keep_events)
+        )
         last_run_current_type = last_run.get(event_type, {})
         start_time = last_run_current_type.get("next_fetch_start_time", epoch_last_day)
         end_time = last_run_current_type.get("next_fetch_end_time", epoch_current_time)
         offset = int(last_run_current_type.get("next_fetch_offset", 0))
         demisto.debug(f"[{coord_id}] Scheduling async task for {event_type}: start={start_time}, end={end_time}, offset={offset}")
         new_tasks.append(
-            handle_event_type_async(client, event_type, start_time, end_time, offset, limit, send_to_xsiam, coord_id)
+            handle_event_type_async(
+                client, event_type, start_time, end_time, offset, limit, send_to_xsiam, coord_id, keep_events=keep_events
+            )
         )
 
     demisto.debug(
@@ -568,6 +621,7 @@ async def handle_fetch_and_send_all_events(
             # event_type_res is in structure of:
             # {'events':[...], ''failures':[...], additional data like next_run_start_time, next_run_offset}
             all_events.extend(event_type_res.pop("events", []))
+            events_count += event_type_res.pop("events_count", 0)
             existing_failures = demisto.get(new_last_run, f"{event_type}.failures", defaultParam=[])
             existing_failures.extend(event_type_res.pop("failures", []))
 
@@ -583,16 +637,18 @@ async def handle_fetch_and_send_all_events(
                 )
             new_last_run[event_type]["failures"] = existing_failures[:MAX_FAILURE_ENTRIES_TO_HANDLE_PER_TYPE]
 
-    demisto.debug(f"Handled {len(all_events)} total events in {time.time() - start:.2f} seconds")
+    demisto.debug(f"Handled {events_count} total events in {time.time() - start:.2f} seconds")
 
-    return all_events, new_last_run
+    return all_events, new_last_run, events_count
 
 
 async def get_events_command_async(
     client: Client, args: dict[str, Any], last_run: dict, send_to_xsiam: bool = False
 ) -> CommandResults:
     limit = arg_to_number(args.get("limit")) or 10
-    events, _ = await handle_fetch_and_send_all_events(client=client, last_run=last_run, limit=limit, send_to_xsiam=send_to_xsiam)
+    events, _, _ = await handle_fetch_and_send_all_events(
+        client=client, last_run=last_run, limit=limit, send_to_xsiam=send_to_xsiam
+    )
 
     for event in events:
         event["timestamp"] = timestamp_to_datestring(event["timestamp"] * 1000)
@@ -660,11 +716,12 @@ async def main() -> None:  # pragma: no cover
 
             elif command_name == "fetch-events":
                 demisto.debug(f"Starting fetch with last run {last_run}")
-                all_events, new_last_run = await handle_fetch_and_send_all_events(
-                    client=client, last_run=last_run, limit=max_fetch, send_to_xsiam=True
+                # the events are only sent to XSIAM, so there is no need to keep them once sent
+                _, new_last_run, events_count = await handle_fetch_and_send_all_events(
+                    client=client, last_run=last_run, limit=max_fetch, send_to_xsiam=True, keep_events=False
                 )
-                demisto.debug(f"Fetched {len(all_events)} total events.")
-                next_trigger_time(len(all_events), max_fetch, new_last_run)
+                demisto.debug(f"Fetched {events_count} total events.")
+                next_trigger_time(events_count, max_fetch, new_last_run)
                 demisto.debug(f"Setting the last_run to: {new_last_run}")
                 demisto.setLastRun(new_last_run)
 
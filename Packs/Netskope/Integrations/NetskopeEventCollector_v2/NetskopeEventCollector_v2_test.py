@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 import demistomock as demisto
+from freezegun import freeze_time
 
 from NetskopeEventCollector_v2 import ALL_SUPPORTED_EVENT_TYPES, Client
 
@@ -98,10 +99,13 @@ async def test_get_all_events(requests_mock, mocker):
     # Mock the get_events_count method to avoid None responses
     mocker.patch.object(client, "get_events_count", return_value=50)
     events = []
-    events, new_last_run = await handle_fetch_and_send_all_events(client, FIRST_LAST_RUN, limit=100, send_to_xsiam=False)
+    events, new_last_run, events_count = await handle_fetch_and_send_all_events(
+        client, FIRST_LAST_RUN, limit=100, send_to_xsiam=False
+    )
     assert isinstance(events, list), f"Expected events to be a list, got {type(events)}"
     assert isinstance(new_last_run, dict), f"Expected new_last_run to be a dict, got {type(new_last_run)}"
     assert len(events) == 26, f"Expected 26 events, got {len(events)}"
+    assert events_count == 26, f"Expected an events count of 26, got {events_count}"
     assert events[0].get("event_id") == "1", f"Expected first event_id to be '1', got {events[0].get('event_id')}"
     assert (
         events[0].get("_time") == "2023-05-22T10:30:16.000Z"
@@ -137,6 +141,34 @@ async def test_get_events_command(mocker):
     assert result is not None, "Expected result to not be None"
 
 
+@pytest.mark.asyncio
+async def test_handle_event_type_async_without_keeping_events(mocker):
+    """
+    Given:
+        - A full page of events to fetch, and keep_events set to False (as done in fetch-events).
+    When:
+        - Running handle_event_type_async.
+    Then:
+        - The events should not be returned, but their count should still drive the next fetch offset.
+    """
+    from NetskopeEventCollector_v2 import handle_event_type_async
+
+    client = Client(BASE_URL, "dummy_token", False, False, event_types_to_fetch=["alert"])
+    mocker.patch.object(
+        client,
+        "get_events_data_async",
+        return_value={"result": [{"_id": "1", "timestamp": 1}, {"_id": "2", "timestamp": 2}]},
+    )
+    mocker.patch.object(client, "get_events_count", return_value=2)
+
+    event_type, res = await handle_event_type_async(client, "alert", "start", "end", 0, 2, False, "test_coord", keep_events=False)
+
+    assert event_type == "alert"
+    assert res["events"] == []
+    assert res["events_count"] == 2
+    assert res["next_fetch_offset"] == 2
+
+
 @pytest.mark.parametrize(
     "event_types_to_fetch_param, expected_value",
     [
@@ -348,6 +380,95 @@ async def test_honor_rate_limiting_async(mocker):
     assert result is False
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "headers, retry_count, expected_sleep",
+    [
+        ({"ratelimit-remaining": "0", "ratelimit-reset": "3"}, 0, 3),
+        ({"Retry-After": "5"}, 0, 5),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"}, 1, 30),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:27:00 GMT"}, 1, 0),
+        ({"Retry-After": "soon"}, 1, 2),
+        (None, 2, 4),
+    ],
+)
+@freeze_time("2015-10-21 07:28:00")
+async def test_wait_before_rate_limit_retry_async(mocker, headers, retry_count, expected_sleep):
+    """
+    Given:
+        - The headers of a 429 response, with rate limit headers, a Retry-After header or neither.
+    When:
+        - Calling wait_before_rate_limit_retry_async.
+    Then:
+        - The rate limit reset value should be used when present, then Retry-After (in seconds or as an HTTP date),
+          and otherwise an exponential backoff based on the retry count.
+    """
+    from NetskopeEventCollector_v2 import wait_before_rate_limit_retry_async
+
+    sleep_mock = mocker.patch("asyncio.sleep", return_value=None)
+    await wait_before_rate_limit_retry_async(headers, "alert", {}, retry_count)
+    sleep_mock.assert_called_once_with(expected_sleep)
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_send_events_async_retries_rate_limit_without_headers(mocker):
+    """
+    Given:
+        - A Netskope API that rejects the first page request with 429 and no rate limit headers.
+    When:
+        - Calling fetch_and_send_events_async.
+    Then:
+        - The page should be fetched again after backing off instead of failing.
+    """
+    from aiohttp import ClientResponseError, RequestInfo
+    from NetskopeEventCollector_v2 import Client, fetch_and_send_events_async
+
+    client = Client(BASE_URL, "token", False, False, ["alert"])
+    rate_limit_error = ClientResponseError(RequestInfo(BASE_URL, "GET", {}, BASE_URL), (), status=429)
+    mocker.patch.object(
+        client, "get_events_data_async", side_effect=[rate_limit_error, {"result": [{"_id": "1", "timestamp": 1}]}]
+    )
+    mocker.patch("asyncio.sleep", return_value=None)
+
+    success, failures = await fetch_and_send_events_async(
+        client, "alert", {"offset": 0, "limit": 1}, 1, send_to_xsiam=False, is_re_fetch_failed_fetch=True
+    )
+
+    assert failures == []
+    assert success[0][1][0]["event_id"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_send_events_async_rate_limit_retries_exhausted(mocker):
+    """
+    Given:
+        - A Netskope API that rejects every page request with 429.
+    When:
+        - Calling fetch_and_send_events_async.
+    Then:
+        - The page should be returned as a failure (so it is re-fetched later) and not as an empty successful page.
+        - There should be no backoff sleep after the last attempt.
+    """
+    from aiohttp import ClientResponseError, RequestInfo
+    from NetskopeEventCollector_v2 import MAX_RETRY, Client, fetch_and_send_events_async
+
+    client = Client(BASE_URL, "token", False, False, ["alert"])
+    rate_limit_error = ClientResponseError(RequestInfo(BASE_URL, "GET", {}, BASE_URL), (), status=429)
+    get_events_mock = mocker.patch.object(client, "get_events_data_async", side_effect=rate_limit_error)
+    sleep_mock = mocker.patch("asyncio.sleep", return_value=None)
+
+    success, failures = await fetch_and_send_events_async(
+        client, "alert", {"offset": 0, "limit": 1}, 1, send_to_xsiam=False, is_re_fetch_failed_fetch=True
+    )
+
+    assert success == []
+    assert len(failures) == 1
+    assert failures[0].exception.status == 429
+    assert failures[0].res == {"offset": 0, "limit": 1}
+    assert get_events_mock.call_count == MAX_RETRY
+    assert sleep_mock.call_count == MAX_RETRY - 1
+
+
 def test_populate_parsing_rule_fields():
     """
     Given:
@@ -363,7 +484,7 @@ def test_populate_parsing_rule_fields():
     event = {"timestamp": 1680000000}
     populate_parsing_rule_fields(event, "alert")
     assert event["source_log_event"] == "alert"
-    assert "_time" in event
+    assert event["_time"] == "2023-03-28T10:40:00.000Z"
     # Test missing timestamp
     event = {}
     populate_parsing_rule_fields(event, "alert")